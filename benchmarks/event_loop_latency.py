@@ -0,0 +1,97 @@
+"""Benchmark of event loop latency while pricing many large baskets.
+
+A heartbeat coroutine sleeps for a fixed interval and records how late it wakes up. The lateness is a measure of how long the event loop was blocked. Run with `python benchmarks/event_loop_latency.py`.
+"""
+
+import asyncio
+import statistics
+import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Any, Dict, List, Optional, Tuple
+
+from shoppingbasket.asyncbasket import AsyncBasket, apply_promotions_gather
+from shoppingbasket.data import PRODUCTS, PROMOTIONS
+
+HEARTBEAT_INTERVAL = 0.001
+
+MANY_PROMOTIONS: Dict[str, Dict[str, Any]] = {
+    f"Promotion {index}": {
+        "qualifying_product": "SOUP",
+        "qualifying_product_quantity": 2,
+        "discounted_product": "BREAD",
+        "percent_discount": index % 100,
+    }
+    for index in range(20_000)
+}
+
+# Scenario name: (number of baskets, products per basket, promotions).
+SCENARIOS: Dict[str, Tuple[int, int, Dict[str, Dict[str, Any]]]] = {
+    "many promotions": (20, 5_000, MANY_PROMOTIONS),
+    "large basket": (2, 1_000_000, PROMOTIONS),
+}
+
+
+def _make_baskets(scenario: str, executor=None) -> List[AsyncBasket]:
+    num_baskets, products_per_basket, promotions = SCENARIOS[scenario]
+    products = [*PRODUCTS] * (products_per_basket // len(PRODUCTS))
+    baskets = []
+
+    for _ in range(num_baskets):
+        basket = AsyncBasket(executor=executor)
+        basket.PROMOTIONS = promotions
+        basket.contents = list(products)
+        baskets.append(basket)
+
+    return baskets
+
+
+async def _heartbeat(lags: List[float], stop: asyncio.Event) -> None:
+    while not stop.is_set():
+        start = time.perf_counter()
+        await asyncio.sleep(HEARTBEAT_INTERVAL)
+        lags.append(time.perf_counter() - start - HEARTBEAT_INTERVAL)
+
+
+async def _run(scenario: str, mode: str, executor=None) -> None:
+    baskets = _make_baskets(scenario, executor)
+    lags: List[float] = []
+    stop = asyncio.Event()
+    heartbeat = asyncio.create_task(_heartbeat(lags, stop))
+    await asyncio.sleep(HEARTBEAT_INTERVAL)
+
+    start = time.perf_counter()
+    if mode == "sync":
+        for basket in baskets:
+            basket.apply_promotions()
+        await asyncio.sleep(0)
+    else:
+        await apply_promotions_gather(baskets, max_concurrency=4)
+    elapsed = time.perf_counter() - start
+
+    stop.set()
+    await heartbeat
+
+    lags_ms = sorted(lag * 1000 for lag in lags)
+    p99 = lags_ms[min(len(lags_ms) - 1, int(len(lags_ms) * 0.99))]
+    print(
+        f"{scenario:<16} {mode:<12} wall {elapsed:7.3f}s  "
+        f"lag median {statistics.median(lags_ms):8.2f}ms  "
+        f"p99 {p99:8.2f}ms  max {lags_ms[-1]:8.2f}ms"
+    )
+
+
+def main(executor_workers: Optional[int] = 4) -> None:
+    """Run the benchmark for each scenario and pricing mode, using the default AsyncBasket settings, and print the heartbeat lag."""
+    for scenario in SCENARIOS:
+        asyncio.run(_run(scenario, "sync"))
+        asyncio.run(_run(scenario, "cooperative"))
+
+        with ThreadPoolExecutor(max_workers=executor_workers) as executor:
+            asyncio.run(_run(scenario, "thread", executor))
+
+        with ProcessPoolExecutor(max_workers=executor_workers) as executor:
+            asyncio.run(_run(scenario, "process", executor))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,147 @@
+"""Module for the AsyncBasket class - an asyncio-friendly Basket which applies promotions without blocking the event loop, plus a helper for pricing many baskets concurrently."""
+
+import asyncio
+import collections
+from concurrent.futures import Executor
+from typing import Any, Counter, Dict, Iterable, List, Optional
+
+from shoppingbasket.basket import Basket
+
+
+def _compute_promotion_discounts(
+    contents: List[str],
+    products: Dict[str, int],
+    promotions: Dict[str, Dict[str, Any]],
+) -> Dict[str, int]:
+    """Compute the promotion discounts for the given contents, counting the products once.
+
+    Module level (rather than a method) so that it can be pickled and sent to a process pool executor.
+
+    Args:
+        contents (List[str]): The products in the basket.
+        products (Dict[str, int]): The available products and their unit price in pence.
+        promotions (Dict[str, Dict[str, Any]]): The promotions to apply.
+
+    Returns:
+        Dict[str, int]: Key value pairs, with keys the promotion name and value the discount in pence.
+    """
+    product_count = collections.Counter(contents)
+
+    return {
+        promotion: Basket._promotion_discount(
+            promotion_details, product_count, products
+        )
+        for promotion, promotion_details in promotions.items()
+    }
+
+
+class AsyncBasket(Basket):
+    """Blueprint for AsyncBasket object."""
+
+    def __init__(
+        self,
+        executor: Optional[Executor] = None,
+        yield_every: int = 100,
+        count_chunk_size: int = 10_000,
+    ) -> None:
+        """Create an AsyncBasket object with no contents.
+
+        Products are added and totals computed exactly as for Basket. Promotions are applied with the apply_promotions_async coroutine, giving the same promotion_discounts as Basket.apply_promotions.
+
+        Args:
+            executor (Optional[Executor]): Thread or process pool executor to offload promotion calculations to. If None, promotions are applied on the event loop, cooperatively yielding control while counting the products and between batches of promotions.
+            yield_every (int): The number of promotions to apply between yields to the event loop when no executor is given.
+            count_chunk_size (int): The number of products to count between yields to the event loop when no executor is given.
+        """
+        super().__init__()
+
+        if yield_every < 1:
+            raise ValueError("yield_every must be a positive integer.")
+
+        if count_chunk_size < 1:
+            raise ValueError("count_chunk_size must be a positive integer.")
+
+        self.executor = executor
+        self.yield_every = yield_every
+        self.count_chunk_size = count_chunk_size
+
+    async def apply_promotions_async(self) -> None:
+        """Apply each promotion from self.PROMOTIONS to the products in the basket without blocking the event loop.
+
+        The contents, products and promotions are copied when called. If any of them change while pricing is suspended, the discounts computed from the copy are discarded rather than applied to the changed basket.
+
+        Raises:
+            RuntimeError: If the contents, products or promotions of the basket changed while promotions were being applied.
+        """
+        contents = list(self.contents)
+        products = dict(self.PRODUCTS)
+        promotions = dict(self.PROMOTIONS)
+
+        if self.executor is not None:
+            loop = asyncio.get_running_loop()
+            promotion_discounts = await loop.run_in_executor(
+                self.executor,
+                _compute_promotion_discounts,
+                contents,
+                products,
+                promotions,
+            )
+        else:
+            product_count: Counter[str] = collections.Counter()
+            for start in range(0, len(contents), self.count_chunk_size):
+                end = start + self.count_chunk_size
+                product_count.update(contents[start:end])
+                await asyncio.sleep(0)
+
+            promotion_discounts = {}
+            for index, (promotion, promotion_details) in enumerate(
+                promotions.items(), start=1
+            ):
+                promotion_discounts[promotion] = self._promotion_discount(
+                    promotion_details, product_count, products
+                )
+
+                if index % self.yield_every == 0:
+                    await asyncio.sleep(0)
+
+        if (
+            self.contents != contents
+            or self.PRODUCTS != products
+            or self.PROMOTIONS != promotions
+        ):
+            raise RuntimeError(
+                "The basket changed while promotions were being applied."
+            )
+
+        self.promotion_discounts = promotion_discounts
+
+
+async def apply_promotions_gather(
+    baskets: Iterable[AsyncBasket], max_concurrency: int = 10
+) -> None:
+    """Apply promotions to many baskets concurrently, with at most max_concurrency baskets being priced at once.
+
+    Baskets are taken from the iterable only as workers become free, so a lazily generated iterable is not consumed ahead of the work. If applying promotions to any basket raises, the baskets still being priced are cancelled, no further baskets are started and the exception is re-raised.
+
+    Args:
+        baskets (Iterable[AsyncBasket]): The baskets to apply promotions to.
+        max_concurrency (int): The maximum number of baskets to price at the same time. Limits the work queued on an executor or interleaved on the event loop.
+    """
+    if max_concurrency < 1:
+        raise ValueError("max_concurrency must be a positive integer.")
+
+    basket_iterator = iter(baskets)
+
+    async def _worker() -> None:
+        for basket in basket_iterator:
+            await basket.apply_promotions_async()
+
+    workers = [asyncio.ensure_future(_worker()) for _ in range(max_concurrency)]
+
+    try:
+        await asyncio.gather(*workers)
+    except BaseException:
+        for worker in workers:
+            worker.cancel()
+        await asyncio.gather(*workers, return_exceptions=True)
+        raise
@@ -88,8 +88,12 @@ class Basket:
 
     def apply_promotions(self) -> None:
         """Apply each promotion from self.PROMOTIONS to the products in the basket."""
+        product_count = self.product_count
+
         for promotion, promotion_details in self.PROMOTIONS.items():
-            self.apply_promotion(promotion, promotion_details)
+            self.promotion_discounts[promotion] = self._promotion_discount(
+                promotion_details, product_count, self.PRODUCTS
+            )
 
     def apply_promotion(
         self, promotion_name: str, promotion_details: Dict[str, Any]
@@ -100,21 +104,39 @@ class Basket:
             promotion_name (str): The name of the promotion to apply.
             promotion_details (Dict[str, Any]): Details of the promotion to be applied. Keys should include qualifying_product, discounted_product, qualifying_product_quantity and percent_discount.
         """
-        qualifying_product_count = self.product_count[
+        self.promotion_discounts[promotion_name] = self._promotion_discount(
+            promotion_details, self.product_count, self.PRODUCTS
+        )
+
+    @staticmethod
+    def _promotion_discount(
+        promotion_details: Dict[str, Any],
+        product_count: Counter[str],
+        products: Dict[str, int],
+    ) -> int:
+        """Compute the discount due to a promotion for the given product counts.
+
+        Args:
+            promotion_details (Dict[str, Any]): Details of the promotion to be applied. Keys should include qualifying_product, discounted_product, qualifying_product_quantity and percent_discount.
+            product_count (Counter[str]): Key value pairs, with keys the product name and value the quantity of that product in the basket.
+            products (Dict[str, int]): Key value pairs, with keys the product name and value the unit price of the product in pence.
+
+        Returns:
+            int: The discount in pence due to the promotion.
+        """
+        qualifying_product_count = product_count[
             promotion_details["qualifying_product"]
         ]
-        discounted_product_count = self.product_count[
+        discounted_product_count = product_count[
             promotion_details["discounted_product"]
         ]
 
         qualifying_product_quantity = promotion_details["qualifying_product_quantity"]
         percent_discount = promotion_details["percent_discount"]
-        unit_price = self.PRODUCTS[promotion_details["discounted_product"]]
+        unit_price = products[promotion_details["discounted_product"]]
 
         num_allowed_discounts = qualifying_product_count // qualifying_product_quantity
 
         discounts_applied = min(num_allowed_discounts, discounted_product_count)
 
-        self.promotion_discounts[promotion_name] = int(
-            discounts_applied * unit_price * percent_discount / 100
-        )
+        return int(discounts_applied * unit_price * percent_discount / 100)
@@ -2,6 +2,7 @@
 
 
 import pytest
+from shoppingbasket.asyncbasket import AsyncBasket
 from shoppingbasket.basket import Basket
 
 
@@ -9,3 +10,9 @@ from shoppingbasket.basket import Basket
 def basket():
     """Return an empty basket object."""
     return Basket()
+
+
+@pytest.fixture
+def async_basket():
+    """Return an empty async basket object."""
+    return AsyncBasket()
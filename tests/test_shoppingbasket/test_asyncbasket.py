@@ -0,0 +1,271 @@
+"""Test suite for the asyncbasket module."""
+
+
+import asyncio
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from typing import List
+
+import pytest
+from shoppingbasket.asyncbasket import AsyncBasket, apply_promotions_gather
+from shoppingbasket.basket import Basket
+
+PRODUCT_LISTS = [
+    [],
+    ["APPLES"],
+    ["APPLES"] * 4 + ["MILK", "CHICKEN", "TEA"],
+    ["BREAD"] * 2 + ["SOUP"],
+    ["BREAD"] * 2 + ["SOUP"] * 4,
+    ["BREAD"] * 2 + ["SOUP"] * 7 + ["APPLES", "MILK"],
+]
+
+
+def _sync_discounts(products: List[str]):
+    basket = Basket()
+    for product in products:
+        basket.add_product(product)
+    basket.apply_promotions()
+    return basket.promotion_discounts
+
+
+class Test_AsyncBasketInit:
+    """Test suite for the AsyncBasket.__init__ method."""
+
+    def test_empty_basket(self, async_basket: AsyncBasket):
+        """Test creating an empty async basket."""
+        assert async_basket.contents == async_basket.invalid == []
+
+        assert async_basket.promotion_discounts == {}
+        assert async_basket.executor is None
+
+    @pytest.mark.parametrize("yield_every", [0, -1])
+    def test_invalid_yield_every(self, yield_every: int):
+        """Test that a non-positive yield_every is rejected."""
+        with pytest.raises(ValueError):
+            AsyncBasket(yield_every=yield_every)
+
+    @pytest.mark.parametrize("count_chunk_size", [0, -1])
+    def test_invalid_count_chunk_size(self, count_chunk_size: int):
+        """Test that a non-positive count_chunk_size is rejected."""
+        with pytest.raises(ValueError):
+            AsyncBasket(count_chunk_size=count_chunk_size)
+
+
+class Test_ApplyPromotionsAsync:
+    """Test suite for the AsyncBasket.apply_promotions_async method."""
+
+    @pytest.mark.parametrize("products", PRODUCT_LISTS)
+    @pytest.mark.parametrize("yield_every", [1, 100])
+    def test_cooperative_matches_basket(self, products: List[str], yield_every: int):
+        """Test applying promotions on the event loop gives the same discounts as Basket."""
+        basket = AsyncBasket(yield_every=yield_every)
+        for product in products:
+            basket.add_product(product)
+
+        asyncio.run(basket.apply_promotions_async())
+
+        assert basket.promotion_discounts == _sync_discounts(products)
+
+    @pytest.mark.parametrize("count_chunk_size", [1, 3, 10_000])
+    def test_count_chunk_size_matches_basket(self, count_chunk_size: int):
+        """Test counting the products in chunks of any size gives the same discounts as Basket."""
+        products = PRODUCT_LISTS[-1]
+        basket = AsyncBasket(count_chunk_size=count_chunk_size)
+        for product in products:
+            basket.add_product(product)
+
+        asyncio.run(basket.apply_promotions_async())
+
+        assert basket.promotion_discounts == _sync_discounts(products)
+
+    def test_large_basket_yields(self, async_basket: AsyncBasket):
+        """Test that a large basket with the default settings and promotions yields to the event loop while being priced."""
+        products = ["SOUP", "BREAD", "APPLES", "MILK"] * 25_000
+        async_basket.contents = list(products)
+        ticks = 0
+
+        async def _ticker(stop: asyncio.Event):
+            nonlocal ticks
+            while not stop.is_set():
+                ticks += 1
+                await asyncio.sleep(0)
+
+        async def _price():
+            stop = asyncio.Event()
+            ticker = asyncio.create_task(_ticker(stop))
+            await asyncio.sleep(0)
+            ticks_before = ticks
+            await async_basket.apply_promotions_async()
+            stop.set()
+            await ticker
+            return ticks - ticks_before
+
+        assert asyncio.run(_price()) >= 10
+        assert async_basket.promotion_discounts == _sync_discounts(products)
+
+    @pytest.mark.parametrize("use_executor", [False, True])
+    def test_mutation_during_pricing(self, use_executor: bool):
+        """Test that emptying the basket while pricing is suspended raises and leaves the basket total consistent."""
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            basket = AsyncBasket(
+                executor=executor if use_executor else None,
+                yield_every=1,
+                count_chunk_size=1,
+            )
+            for product in ["BREAD"] * 2 + ["SOUP"] * 4 + ["APPLES"]:
+                basket.add_product(product)
+
+            async def _mutate():
+                basket.empty_basket()
+
+            async def _price():
+                await asyncio.gather(basket.apply_promotions_async(), _mutate())
+
+            with pytest.raises(RuntimeError):
+                asyncio.run(_price())
+
+        assert basket.contents == []
+        assert basket.promotion_discounts == {}
+        assert basket.total == basket.subtotal == 0
+
+    def test_unchanged_basket_after_pricing(self, async_basket: AsyncBasket):
+        """Test that pricing a basket and then adding a product leaves the discounts from the priced contents, as for Basket."""
+        products = ["BREAD"] * 2 + ["SOUP"] * 4
+        for product in products:
+            async_basket.add_product(product)
+
+        asyncio.run(async_basket.apply_promotions_async())
+        async_basket.add_product("MILK")
+
+        assert async_basket.promotion_discounts == _sync_discounts(products)
+        assert async_basket.total == async_basket.subtotal - 80
+
+    @pytest.mark.parametrize("products", PRODUCT_LISTS)
+    def test_thread_executor_matches_basket(self, products: List[str]):
+        """Test applying promotions on a thread pool gives the same discounts as Basket."""
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            basket = AsyncBasket(executor=executor)
+            for product in products:
+                basket.add_product(product)
+
+            asyncio.run(basket.apply_promotions_async())
+
+        assert basket.promotion_discounts == _sync_discounts(products)
+
+    def test_process_executor_matches_basket(self):
+        """Test applying promotions on a process pool gives the same discounts and totals as Basket."""
+        products = PRODUCT_LISTS[-1]
+
+        with ProcessPoolExecutor(max_workers=1) as executor:
+            basket = AsyncBasket(executor=executor)
+            for product in products:
+                basket.add_product(product)
+
+            asyncio.run(basket.apply_promotions_async())
+
+        assert basket.promotion_discounts == _sync_discounts(products)
+        assert basket.total_discount == 90
+        assert basket.total == 755
+
+
+class Test_ApplyPromotionsGather:
+    """Test suite for the apply_promotions_gather function."""
+
+    @pytest.mark.parametrize("max_concurrency", [1, 3, 100])
+    def test_many_baskets(self, max_concurrency: int):
+        """Test applying promotions to many baskets concurrently gives the same discounts as Basket."""
+        baskets = []
+        for products in PRODUCT_LISTS * 5:
+            basket = AsyncBasket(yield_every=1)
+            for product in products:
+                basket.add_product(product)
+            baskets.append(basket)
+
+        asyncio.run(apply_promotions_gather(baskets, max_concurrency=max_concurrency))
+
+        for basket, products in zip(baskets, PRODUCT_LISTS * 5):
+            assert basket.promotion_discounts == _sync_discounts(products)
+
+    def test_concurrency_limit(self, monkeypatch):
+        """Test that no more than max_concurrency baskets are priced at once."""
+        in_flight = 0
+        peak = 0
+
+        async def _slow_apply(self):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.001)
+            in_flight -= 1
+
+        monkeypatch.setattr(AsyncBasket, "apply_promotions_async", _slow_apply)
+
+        asyncio.run(
+            apply_promotions_gather(
+                [AsyncBasket() for _ in range(10)], max_concurrency=3
+            )
+        )
+
+        assert peak == 3
+
+    @pytest.mark.parametrize("max_concurrency", [0, -1])
+    def test_invalid_max_concurrency(self, max_concurrency: int):
+        """Test that a non-positive max_concurrency is rejected."""
+        with pytest.raises(ValueError):
+            asyncio.run(apply_promotions_gather([], max_concurrency=max_concurrency))
+
+    def test_failure_cancels_remaining_baskets(self, monkeypatch):
+        """Test that a basket raising cancels the baskets being priced and starts no further baskets."""
+        started = 0
+        cancelled = 0
+        completed = 0
+        failing_basket = AsyncBasket()
+
+        async def _apply(self):
+            nonlocal started, cancelled, completed
+            started += 1
+            if self is failing_basket:
+                raise ValueError("Pricing failed.")
+            try:
+                await asyncio.sleep(1)
+            except asyncio.CancelledError:
+                cancelled += 1
+                raise
+            completed += 1
+
+        monkeypatch.setattr(AsyncBasket, "apply_promotions_async", _apply)
+
+        baskets = [AsyncBasket(), AsyncBasket(), failing_basket] + [
+            AsyncBasket() for _ in range(7)
+        ]
+
+        with pytest.raises(ValueError):
+            asyncio.run(apply_promotions_gather(baskets, max_concurrency=3))
+
+        assert started == 3
+        assert cancelled == 2
+        assert completed == 0
+
+    def test_lazy_iterable(self, monkeypatch):
+        """Test that baskets are taken from the iterable only as workers become free."""
+        created = 0
+        finished = 0
+        peak_ahead = 0
+
+        async def _apply(self):
+            nonlocal finished, peak_ahead
+            peak_ahead = max(peak_ahead, created - finished)
+            await asyncio.sleep(0)
+            finished += 1
+
+        monkeypatch.setattr(AsyncBasket, "apply_promotions_async", _apply)
+
+        def _baskets():
+            nonlocal created
+            for _ in range(10):
+                created += 1
+                yield AsyncBasket()
+
+        asyncio.run(apply_promotions_gather(_baskets(), max_concurrency=2))
+
+        assert finished == 10
+        assert peak_ahead == 2